@@ -1,15 +1,21 @@
 import json
 from typing import Any, Dict
 
-from .json_validate import is_valid_node_dict, is_valid_workflow_dict
+from .json_validate import is_valid_node_dict, is_valid_workflow_dict, orjson, _json_loads
 from Logger import ReadFileNotFoundError, JSONTopLevelNotObject
 
 
 def read_json_file(path: str) -> Dict[str, Any]:
     """从文件读取 JSON 并返回 dict。"""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            # parse the raw UTF-8 bytes, no intermediate str; `_json_loads` falls back
+            # to json.loads where orjson would differ (big ints, NaN/Infinity)
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
     except FileNotFoundError as e:
         raise ReadFileNotFoundError(str(e))
     if not isinstance(data, dict):
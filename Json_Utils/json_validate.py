@@ -1,4 +1,5 @@
 import json
+import re
 from collections import deque
 from typing import Any, Union
 
@@ -32,6 +33,33 @@ from Logger import (
     NodeTypeMustBeString,
 )
 
+try:
+    # optional fast parser; accepts str/bytes and returns the same objects as json.loads
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
+
+
+# orjson 把超出 64 位范围的整数静默解析为 float（丢失精度），而 json.loads 保持精确的 int；
+# 含 19 位以上连续数字的输入直接交给标准库（可能误判字符串内的数字，只是多走慢路径）
+_LONG_DIGITS_STR = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+def _json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """优先用 orjson 解析，结果与 json.loads 一致。
+
+    可能含超出 64 位整数的输入，以及 orjson 拒绝的 NaN/Infinity，改用 json.loads 解析。
+    """
+    if orjson is not None:
+        pattern = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if pattern.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
 
 def _validate_workflow_dag(nodes: list[dict]) -> None:
     """基于 nodes[].outputs 做 DAG 校验；若存在环则抛出 WorkflowDictValidationError。"""
@@ -65,23 +93,43 @@ def _validate_workflow_dag(nodes: list[dict]) -> None:
         raise WorkflowDictValidationError("Workflow graph must be a DAG (cycle detected in node outputs)")
 
 #安全转化dict
-def _ensure_dict(data: Union[str, dict, Any]) -> dict:
-    """尝试把输入转为 dict,失败时抛出 ValueError。"""
+def _ensure_dict(data: Union[str, bytes, bytearray, dict, Any]) -> dict:
+    """尝试把输入转为 dict,失败时抛出 ValueError。
+
+    接受 dict、JSON 字符串或未解码的 UTF-8 bytes(如原始请求体),bytes 直接交给解析器，无需先 decode。
+    """
     if isinstance(data, dict):
         return data
-    if isinstance(data, str):
+    if isinstance(data, (str, bytes, bytearray)):
         try:
-            parsed = json.loads(data)
-            if isinstance(parsed, dict):
-                return parsed
-            raise JSONDoesNotRepresentObject()
-        except Exception as e:
-            raise InvalidJSON(str(e))
+            parsed = _json_loads(data)
+        except ValueError as e:
+            # json.JSONDecodeError / orjson.JSONDecodeError (both ValueError), bad UTF-8 bytes
+            raise InvalidJSON(str(e)) from e
+        if isinstance(parsed, dict):
+            return parsed
+        raise JSONDoesNotRepresentObject()
     raise UnsupportedDataTypeError()
 
+# pydantic v2 可在一次（Rust 层）遍历中完成 JSON 解析与模型校验；v1 无此接口
+def _validate_json_in_one_pass(model: Any, data: Any) -> Any:
+    """对 str/bytes 输入尝试 `model.model_validate_json`；成功返回模型实例，否则返回 None。
+
+    失败时返回 None 而不抛错，由调用方走原有的「解析 + 校验」路径，从而保持原有的错误类型与信息。
+    """
+    validate_json = getattr(model, "model_validate_json", None)
+    if validate_json is None or not isinstance(data, (str, bytes, bytearray)):
+        return None
+    try:
+        return validate_json(data)
+    except Exception:
+        return None
+
 #校验node pydantic payload
-def is_valid_node_payload(data: Union[str, dict, Any]) -> bool:
+def is_valid_node_payload(data: Union[str, bytes, dict, Any]) -> bool:
     """验证 `NodePayload`，校验失败时抛出 `NodePayloadValidationError`。成功返回 True。"""
+    if _validate_json_in_one_pass(NodePayload, data) is not None:
+        return True
     try:
         d = _ensure_dict(data)
     except ValueError as e:
@@ -95,15 +143,19 @@ def is_valid_node_payload(data: Union[str, dict, Any]) -> bool:
         raise NodePayloadValidationError(str(e))
 
 #校验workflow pydantic payload
-def is_valid_workflow_payload(data: Union[str, dict, Any]) -> bool:
+def is_valid_workflow_payload(data: Union[str, bytes, dict, Any]) -> bool:
     """验证 `WorkflowPayload`，校验失败时抛出 `WorkflowPayloadValidationError`。成功返回 True。"""
+    wf = _validate_json_in_one_pass(WorkflowPayload, data)
+    if wf is None:
+        try:
+            d = _ensure_dict(data)
+        except ValueError as e:
+            raise WorkflowPayloadValidationError(str(e))
     try:
-        d = _ensure_dict(data)
-    except ValueError as e:
-        raise WorkflowPayloadValidationError(str(e))
-    try:
-        wf = WorkflowPayload(**d)
-        nodes = [n.dict() for n in wf.nodes]
+        if wf is None:
+            wf = WorkflowPayload(**d)
+        # DAG 校验只需要 id/outputs，不必把整个节点模型（含 params/context）再导出为 dict
+        nodes = [{"id": n.id, "outputs": n.outputs} for n in wf.nodes]
         _validate_workflow_dag(nodes)
         return True
     except ValidationError as ve:
@@ -113,24 +165,31 @@ def is_valid_workflow_payload(data: Union[str, dict, Any]) -> bool:
     except Exception as e:
         raise WorkflowPayloadValidationError(str(e))
 
-#校验node python dict
-def is_valid_node_dict(d: Any) -> bool:
-    """针对已解析的 Python dict 做结构校验，校验失败时抛出 `NodeDictValidationError`。"""
-    if not isinstance(d, dict):
-        raise PayloadNotADict()
-    # 必需字段
-    if "type" not in d or not isinstance(d["type"], str):
-        raise TypeMissingOrInvalid()
+# 元素类型白名单：`issuperset(map(type, items))` 在 C 层完成遍历，比逐个 isinstance 的生成器快；
+# 包含 bool 以覆盖解析 JSON 得到的全部情况。精确类型不命中时（如 IntEnum 等 int 子类）
+# 再回退到 isinstance 逐个判定，判定结果与 isinstance(x, int) 完全一致
+_INT_TYPES = frozenset({int, bool})
+_INT_OR_NONE_TYPES = frozenset({int, bool, type(None)})
+
+
+def _all_int(items: list) -> bool:
+    return _INT_TYPES.issuperset(map(type, items)) or all(isinstance(x, int) for x in items)
+
+
+def _all_int_or_none(items: list) -> bool:
+    return _INT_OR_NONE_TYPES.issuperset(map(type, items)) or all(x is None or isinstance(x, int) for x in items)
+
+
+#node 字段校验（node dict 与 workflow 内节点共用）
+def _validate_node_fields(inputs: Any, outputs: Any, params: Any, context: Any, listen: Any) -> None:
+    """校验节点除 `type` 外的字段，失败时抛出对应的 `*MissingOrInvalid` 错误。"""
     # inputs
-    inputs = d.get("inputs", [])
-    if not isinstance(inputs, list) or not all(isinstance(i, int) for i in inputs):
+    if not isinstance(inputs, list) or not _all_int(inputs):
         raise InputsMissingOrInvalid()
     # outputs
-    outputs = d.get("outputs", [])
-    if not isinstance(outputs, list) or not all((isinstance(o, int) or o is None) for o in outputs):
+    if not isinstance(outputs, list) or not _all_int_or_none(outputs):
         raise OutputsMissingOrInvalid()
     # params
-    params = d.get("params", None)
     if not isinstance(params, dict):
         raise ParamsMissingOrInvalid()
     # context_slot in params should be list of objects {id:int, key:str}
@@ -146,13 +205,27 @@ def is_valid_node_dict(d: Any) -> bool:
             if "key" not in item or not isinstance(item.get("key"), str):
                 raise ParamsMissingOrInvalid()
     # context (node-level) should be an object/dict
-    context = d.get("context", {})
     if context is not None and not isinstance(context, dict):
         raise ParamsMissingOrInvalid()
     # listen
-    listen = d.get("listen", [])
-    if listen is not None and (not isinstance(listen, list) or not all(isinstance(i, int) for i in listen)):
+    if listen is not None and (not isinstance(listen, list) or not _all_int(listen)):
         raise ListenMissingOrInvalid()
+
+#校验node python dict
+def is_valid_node_dict(d: Any) -> bool:
+    """针对已解析的 Python dict 做结构校验，校验失败时抛出 `NodeDictValidationError`。"""
+    if not isinstance(d, dict):
+        raise PayloadNotADict()
+    # 必需字段
+    if "type" not in d or not isinstance(d["type"], str):
+        raise TypeMissingOrInvalid()
+    _validate_node_fields(
+        d.get("inputs", []),
+        d.get("outputs", []),
+        d.get("params", None),
+        d.get("context", {}),
+        d.get("listen", []),
+    )
     return True
 
 #校验workflow python dict
@@ -174,18 +247,14 @@ def is_valid_workflow_dict(d: Any) -> bool:
             raise NodeIDMustBeInteger()
         if "type" not in n or not isinstance(n.get("type"), str):
             raise NodeTypeMustBeString()
-        # reuse node dict checks for node-like fields
-        try:
-            is_valid_node_dict({
-                "type": n.get("type"),
-                "inputs": n.get("inputs", []),
-                "outputs": n.get("outputs", []),
-                "params": n.get("params", {}),
-                "listen": n.get("listen", []),
-                "context": n.get("context", {}),
-            })
-        except NodeDictValidationError as nde:
-            raise nde
+        # reuse node field checks (type already checked above); missing params default to {}
+        _validate_node_fields(
+            n.get("inputs", []),
+            n.get("outputs", []),
+            n.get("params", {}),
+            n.get("context", {}),
+            n.get("listen", []),
+        )
 
     _validate_workflow_dag(nodes)
     return True
@@ -8,10 +8,39 @@ Goals:
 The wrapper consults `Workflow.llm_config` for default credentials but allows
 caller-provided overrides.
 """
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Callable
 import asyncio
+import atexit
 import os
 import logging
+import random
+import threading
+import time
+import weakref
+
+import json
+
+try:
+    # optional fast parser for raw HTTP response bodies
+    import orjson
+    _json_loads = orjson.loads
+except Exception:
+    orjson = None  # type: ignore
+    _json_loads = json.loads
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_dumps_str(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
 
 # Logger for LLM client diagnostics
 logger = logging.getLogger("oriflow.llm")
@@ -22,6 +51,289 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 
+# Transient failures (429 rate limits, 5xx, connection errors) are retried with
+# jittered exponential backoff, honoring Retry-After. The openai SDK does this
+# itself given `max_retries`; the direct HTTP path uses `_retry_delay` below.
+DEFAULT_MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 60.0
+_RETRY_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+def _bind_chat_create(client: Any) -> None:
+    """Stash the bound `client.chat.completions.create` as `client._create_chat`.
+
+    Pooled clients live for the whole process, so the attribute chain is resolved
+    once here instead of on every call. None if the client has no chat API.
+    """
+    completions = getattr(getattr(client, "chat", None), "completions", None)
+    client._create_chat = getattr(completions, "create", None)
+
+
+def _new_client(api_key: Optional[str], base_url: Optional[str], max_retries: int = DEFAULT_MAX_RETRIES):
+    import openai
+
+    client = openai.OpenAI(api_key=api_key, base_url=base_url, max_retries=max_retries)
+    _bind_chat_create(client)
+    return client
+
+
+# (api_key, base_url, max_retries) -> openai.OpenAI, least recently used first;
+# at most CLIENT_POOL_SIZE clients are kept. Evicted clients are only dropped from
+# the pool, not closed: callers may still hold them (a thread mid-`generate`, a
+# live stream, `poll_batch`), and they are closed once garbage collected
+CLIENT_POOL_SIZE = 32
+_clients: "OrderedDict[Any, Any]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _get_client(api_key: Optional[str], base_url: Optional[str], max_retries: int = DEFAULT_MAX_RETRIES):
+    """Return a shared `openai.OpenAI` client for (api_key, base_url, max_retries).
+
+    Each client owns an httpx connection pool; reusing it keeps TCP/TLS
+    connections alive across calls instead of handshaking on every request.
+    The client is safe to share between threads. Pooling is per credential set;
+    beyond `CLIENT_POOL_SIZE` sets the least recently used client is dropped.
+    """
+    key = (api_key, base_url, max_retries)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is not None:
+            _clients.move_to_end(key)
+            return client
+        client = _clients[key] = _new_client(api_key, base_url, max_retries)
+        if len(_clients) > CLIENT_POOL_SIZE:
+            _clients.popitem(last=False)
+    return client
+
+
+# event loop -> {(api_key, base_url): openai.AsyncOpenAI}; an async client's
+# connection pool is bound to the loop it runs on, so clients are pooled per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(api_key: Optional[str], base_url: Optional[str], max_retries: int = DEFAULT_MAX_RETRIES):
+    """Return a shared `openai.AsyncOpenAI` client for (api_key, base_url, max_retries) on the running loop."""
+    import openai
+
+    per_loop = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    key = (api_key, base_url, max_retries)
+    client = per_loop.get(key)
+    if client is None:
+        client = per_loop[key] = openai.AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=max_retries)
+        _bind_chat_create(client)
+    return client
+
+
+def _extract_chat_text(resp: Any) -> str:
+    """Text of the first choice of a chat completion response."""
+    choice0 = resp.choices[0]
+    msg = getattr(choice0, "message", None)
+    if isinstance(msg, dict):
+        return msg.get("content", "") or ""
+    try:
+        return msg.content or ""
+    except Exception:
+        pass
+    return getattr(choice0, "text", "") or ""
+
+
+# Direct HTTP fast path: POST chat completions straight to the endpoint, skipping
+# the openai SDK's request building and response model wrapping. Async calls go
+# through a pooled `aiohttp.ClientSession` when aiohttp is installed (it keeps
+# scaling at high concurrency where `httpx.AsyncClient`, also used by the SDK,
+# flattens out), else a pooled `httpx.AsyncClient`; sync calls use `httpx.Client`.
+# Enable by setting this flag (or ORIFLOW_LLM_HTTP_FAST_PATH=1).
+USE_HTTP_FAST_PATH = os.environ.get("ORIFLOW_LLM_HTTP_FAST_PATH", "").lower() in ("1", "true", "yes")
+HTTP_TIMEOUT = 30.0
+HTTP_MAX_CONNECTIONS = 1000
+
+_http_client = None
+_http_client_lock = threading.Lock()
+# event loop -> httpx.AsyncClient / aiohttp.ClientSession (see `_async_clients`)
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_aiohttp_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _http_limits():
+    import httpx
+
+    return httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=100)
+
+
+def _get_http_client():
+    """Return the shared `httpx.Client` used for direct HTTP calls."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+
+                _http_client = httpx.Client(timeout=HTTP_TIMEOUT, limits=_http_limits())
+    return _http_client
+
+
+def _get_async_http_client():
+    """Return the shared `httpx.AsyncClient` for the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        import httpx
+
+        client = _async_http_clients[loop] = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=_http_limits())
+    return client
+
+
+def _get_aiohttp_session(aiohttp: Any):
+    """Return the shared `aiohttp.ClientSession` for the running loop."""
+    loop = asyncio.get_running_loop()
+    session = _aiohttp_sessions.get(loop)
+    if session is None or session.closed:
+        session = _aiohttp_sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_MAX_CONNECTIONS, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        )
+    return session
+
+
+def _chat_completions_url(base: Optional[str]) -> str:
+    base = (base or "https://api.openai.com").rstrip("/")
+    # Smart URL concatenation: don't double up /v1 or /chat/completions
+    if "/chat/completions" in base:
+        return base
+    if "/v1" in base:
+        return base + "/chat/completions"
+    return base + "/v1/chat/completions"
+
+
+def _http_headers(api_key: Optional[str]) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+
+def _extract_http_text(j: Any) -> str:
+    """Text from a raw chat completion (or responses API) JSON body."""
+    if "choices" in j and isinstance(j["choices"], list) and j["choices"]:
+        ch = j["choices"][0]
+        # gpt responses may have message.content
+        if "message" in ch and isinstance(ch["message"], dict):
+            return ch["message"].get("content", "") or ""
+        if "text" in ch:
+            return ch.get("text", "") or ""
+    # fallback: try responses.output
+    if "output" in j:
+        out = j["output"]
+        if isinstance(out, list) and out:
+            first = out[0]
+            if isinstance(first, dict) and "content" in first:
+                cont = first["content"]
+                if isinstance(cont, list) and cont:
+                    c0 = cont[0]
+                    if isinstance(c0, dict) and "text" in c0:
+                        return c0.get("text", "") or ""
+    return str(j)
+
+
+def _retry_delay(attempt: int, resp: Any = None) -> float:
+    """Seconds to wait before retry `attempt` (0-based): Retry-After if given, else full-jitter backoff."""
+    retry_after = resp.headers.get("retry-after") if resp is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def _http_chat_completion(api_key: Optional[str], base: Optional[str], body: Dict[str, Any],
+                          max_retries: int = DEFAULT_MAX_RETRIES) -> Dict[str, Any]:
+    """POST `body` to the chat completions endpoint; returns the decoded JSON response."""
+    import httpx
+
+    client = _get_http_client()
+    url = _chat_completions_url(base)
+    headers = _http_headers(api_key)
+    # serialize once (orjson when available), outside the retry loop
+    content = _json_dumps_bytes(body)
+    for attempt in range(max_retries + 1):
+        try:
+            resp = client.post(url, content=content, headers=headers)
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+            time.sleep(_retry_delay(attempt))
+            continue
+        if resp.status_code in _RETRY_STATUS and attempt < max_retries:
+            time.sleep(_retry_delay(attempt, resp))
+            continue
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+
+async def _http_chat_completion_async(api_key: Optional[str], base: Optional[str], body: Dict[str, Any],
+                                      max_retries: int = DEFAULT_MAX_RETRIES) -> Dict[str, Any]:
+    url = _chat_completions_url(base)
+    headers = _http_headers(api_key)
+    # serialize once (orjson when available), outside the retry loop
+    content = _json_dumps_bytes(body)
+    try:
+        import aiohttp
+    except ImportError:
+        return await _httpx_chat_completion_async(url, content, headers, max_retries)
+    session = _get_aiohttp_session(aiohttp)
+    for attempt in range(max_retries + 1):
+        try:
+            async with session.post(url, data=content, headers=headers) as resp:
+                raw = await resp.read()
+                if resp.status in _RETRY_STATUS and attempt < max_retries:
+                    delay = _retry_delay(attempt, resp)
+                else:
+                    resp.raise_for_status()
+                    return _json_loads(raw)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= max_retries:
+                raise
+            delay = _retry_delay(attempt)
+        await asyncio.sleep(delay)
+
+
+async def _httpx_chat_completion_async(url: str, content: bytes, headers: Dict[str, str],
+                                       max_retries: int = DEFAULT_MAX_RETRIES) -> Dict[str, Any]:
+    import httpx
+
+    client = _get_async_http_client()
+    for attempt in range(max_retries + 1):
+        try:
+            resp = await client.post(url, content=content, headers=headers)
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+        if resp.status_code in _RETRY_STATUS and attempt < max_retries:
+            await asyncio.sleep(_retry_delay(attempt, resp))
+            continue
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+
+@atexit.register
+def _close_pooled_clients() -> None:
+    global _http_client
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+    if _http_client is not None:
+        try:
+            _http_client.close()
+        except Exception:
+            pass
+        _http_client = None
+
+
 class LLMClient:
     """A small LLM client wrapper.
 
@@ -29,12 +341,15 @@ class LLMClient:
         backend: 'openai'
         api_key: optional API key override
         endpoint: optional API base/endpoint override
+        max_retries: retries for transient errors (rate limits, 5xx, connection errors)
     """
 
-    def __init__(self, backend: str = "openai", api_key: Optional[str] = None, endpoint: Optional[str] = None):
+    def __init__(self, backend: str = "openai", api_key: Optional[str] = None, endpoint: Optional[str] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES):
         self.backend = backend
         self.api_key = api_key
         self.endpoint = endpoint
+        self.max_retries = max_retries
 
     def _get_creds(self) -> Dict[str, Optional[str]]:
         if self.api_key is not None or self.endpoint is not None:
@@ -46,17 +361,35 @@ class LLMClient:
         except Exception:
             return {"api_key": None, "endpoint": None}
 
-    def generate(self, prompt: str, model: str = "minimax/minimax-m2.5", max_tokens: int = 256, **kwargs: Any) -> str:
-        """Synchronous generation helper.
+    def _client_args(self):
+        """(api_key, base_url) from configured credentials, falling back to the OPENAI_* env vars."""
+        creds = self._get_creds() or {}
+        client_key = creds.get("api_key") or os.environ.get("OPENAI_API_KEY")
+        client_base = creds.get("endpoint") or os.environ.get("OPENAI_API_BASE")
+        if client_base:
+            client_base = client_base.rstrip("/")
+        return client_key, client_base
 
-        Returns generated text (string). Raises RuntimeError on misconfiguration.
-        """
+    def _resolve_model(self, model: str) -> str:
         # Automatically use requested minimax model if no official OpenAI endpoint is used
         if model in ["gpt-3.5-turbo", "qnas-v1"]:
             base = self.endpoint or os.environ.get("OPENAI_API_BASE") or ""
             if "openai.com" not in base:
                 logger.info(f"Using requested model: minimax/minimax-m2.5")
                 model = "minimax/minimax-m2.5"
+        return model
+
+    def generate(self, prompt: str, model: str = "minimax/minimax-m2.5", max_tokens: int = 256, **kwargs: Any) -> str:
+        """Synchronous generation helper.
+
+        Returns generated text (string). Raises RuntimeError on misconfiguration.
+        """
+        model = self._resolve_model(model)
+
+        if self.backend == "openai" and USE_HTTP_FAST_PATH:
+            client_key, client_base = self._client_args()
+            body = {"model": model, "messages": [{"role": "user", "content": prompt}], "max_tokens": max_tokens, **kwargs}
+            return _extract_http_text(_http_chat_completion(client_key, client_base, body, self.max_retries))
 
         if self.backend == "openai":
             try:
@@ -110,12 +443,9 @@ class LLMClient:
                     
                     if client_key:
                         masked = f"{client_key[:4]}...{client_key[-4:]}" if len(client_key) > 8 else "***"
-                        logger.info(f"Instantiating OpenAI client with key {masked} and base {client_base}")
+                        logger.info(f"Using OpenAI client with key {masked} and base {client_base}")
                     
-                    client = OpenAIClass(
-                        api_key=client_key,
-                        base_url=client_base
-                    )
+                    client = _get_client(client_key, client_base, self.max_retries)
                 except Exception:
                     logger.exception("Failed to instantiate OpenAI client; aborting new-client path")
                     client = None
@@ -123,29 +453,21 @@ class LLMClient:
                 # Try Chat Completions via new client
                 try:
                     messages = [{"role": "user", "content": prompt}]
-                    logger.info("New client attributes: chat=%s, responses=%s", hasattr(client, "chat"), hasattr(client, "responses"))
 
                     if client is None:
                         raise RuntimeError("OpenAI client instance is None after instantiation")
 
-                    if hasattr(client, "chat") and hasattr(client.chat, "completions"):
+                    # chat API capability was resolved once when the pooled client was created
+                    if client._create_chat is not None:
                         try:
-                            resp = client.chat.completions.create(model=model, messages=messages, max_tokens=max_tokens, **kwargs)
+                            resp = client._create_chat(model=model, messages=messages, max_tokens=max_tokens, **kwargs)
                             logger.info("Used new client.chat.completions.create")
                         except Exception as e:
                             logger.exception("client.chat.completions.create failed: %s", e)
                             raise
 
                         try:
-                            choice0 = resp.choices[0]
-                            msg = getattr(choice0, "message", None)
-                            if isinstance(msg, dict):
-                                return msg.get("content", "") or ""
-                            try:
-                                return msg.content or ""
-                            except Exception:
-                                pass
-                            return getattr(choice0, "text", "") or ""
+                            return _extract_chat_text(resp)
                         except Exception:
                             logger.exception("Failed to extract content from chat completion response")
                             return ""
@@ -175,52 +497,26 @@ class LLMClient:
                             logger.exception("Failed to extract content from responses API result")
                             return str(resp)
 
+                except getattr(openai, "APIError", ()):
+                    # API errors (rate limit, auth, 5xx) were already retried `max_retries`
+                    # times by the SDK; keep their type and don't re-issue the request
+                    raise
                 except Exception as e:
                     # Log and attempt HTTP fallback to endpoint (bypass openai package)
                     logger.exception("New OpenAI client path failed: %s", e)
                     # If we have an api key and endpoint, try a direct HTTP call using httpx
                     try:
-                        import httpx
-
                         api_key_for_http = creds_api_key or os.environ.get("OPENAI_API_KEY")
-                        base = creds_endpoint or os.environ.get("OPENAI_API_BASE") or "https://api.openai.com"
-                        base = base.rstrip("/")
-                        
-                        # Smart URL concatenation: don't double up /v1 or /chat/completions
-                        if "/chat/completions" in base:
-                            url = base
-                        elif "/v1" in base:
-                            url = base + "/chat/completions"
-                        else:
-                            url = base + "/v1/chat/completions"
+                        base = creds_endpoint or os.environ.get("OPENAI_API_BASE")
+                        url = _chat_completions_url(base)
 
-                        headers = {"Authorization": f"Bearer {api_key_for_http}", "Content-Type": "application/json"}
                         body = {"model": model, "messages": [{"role": "user", "content": prompt}], "max_tokens": max_tokens}
                         logger.info("Attempting HTTP fallback to %s", url)
-                        resp = httpx.post(url, json=body, headers=headers, timeout=30.0)
+                        resp = _get_http_client().post(url, content=_json_dumps_bytes(body), headers=_http_headers(api_key_for_http))
                         if resp.status_code >= 200 and resp.status_code < 300:
-                            j = resp.json()
                             # try to extract text from chat completion shape
                             try:
-                                if "choices" in j and isinstance(j["choices"], list) and j["choices"]:
-                                    ch = j["choices"][0]
-                                    # gpt responses may have message.content
-                                    if "message" in ch and isinstance(ch["message"], dict):
-                                        return ch["message"].get("content", "") or ""
-                                    if "text" in ch:
-                                        return ch.get("text", "") or ""
-                                # fallback: try responses.output
-                                if "output" in j:
-                                    out = j["output"]
-                                    if isinstance(out, list) and out:
-                                        first = out[0]
-                                        if isinstance(first, dict) and "content" in first:
-                                            cont = first["content"]
-                                            if isinstance(cont, list) and cont:
-                                                c0 = cont[0]
-                                                if isinstance(c0, dict) and "text" in c0:
-                                                    return c0.get("text", "") or ""
-                                return str(j)
+                                return _extract_http_text(_json_loads(resp.content))
                             except Exception:
                                 return resp.text
                         else:
@@ -280,13 +576,220 @@ class LLMClient:
             raise RuntimeError(f"unknown or unsupported backend: {self.backend}")
 
     async def generate_async(self, prompt: str, model: str = "gpt-3.5-turbo", max_tokens: int = 256, **kwargs: Any) -> str:
-        """Async wrapper around `generate`.
+        """Async generation helper.
+
+        Awaits `openai.AsyncOpenAI` chat completions directly on the running loop, so
+        many prompts can be in flight over one connection pool without a thread each:
+
+            texts = await asyncio.gather(*(client.generate_async(p) for p in prompts))
 
-        Uses `asyncio.to_thread` so the sync openai client can be used safely.
+        Falls back to running `generate` in a thread (`asyncio.to_thread`) when the
+        async client is unavailable or the call fails, keeping its fallback paths.
         """
+        if self.backend == "openai" and USE_HTTP_FAST_PATH:
+            client_key, client_base = self._client_args()
+            body = {"model": self._resolve_model(model), "messages": [{"role": "user", "content": prompt}],
+                    "max_tokens": max_tokens, **kwargs}
+            return _extract_http_text(await _http_chat_completion_async(client_key, client_base, body, self.max_retries))
+
+        if self.backend == "openai":
+            try:
+                import openai
+            except Exception:
+                openai = None
+            if openai is not None and getattr(openai, "AsyncOpenAI", None) is not None:
+                client_key, client_base = self._client_args()
+                try:
+                    client = _get_async_client(client_key, client_base, self.max_retries)
+                    messages = [{"role": "user", "content": prompt}]
+                    resp = await client._create_chat(
+                        model=self._resolve_model(model), messages=messages, max_tokens=max_tokens, **kwargs
+                    )
+                    return _extract_chat_text(resp)
+                except getattr(openai, "APIError", ()):
+                    # API errors (rate limit, auth, 5xx after retries) keep their type so
+                    # callers can dispatch on them; re-issuing via the thread path won't help
+                    raise
+                except Exception as e:
+                    logger.warning("Async client path failed (%s); falling back to threaded generate", e)
         return await asyncio.to_thread(self.generate, prompt, model, max_tokens, **kwargs)
 
+    def generate_stream(self, prompt: str, model: str = "minimax/minimax-m2.5", max_tokens: int = 256, **kwargs: Any):
+        """Stream a chat completion, yielding text deltas as they arrive.
+
+        The first tokens can be shown or processed while the rest of the answer is
+        still being generated; `"".join(...)` of the chunks equals `generate()`'s text.
+        """
+        if self.backend != "openai":
+            raise RuntimeError(f"unknown or unsupported backend: {self.backend}")
+        client = _get_client(*self._client_args(), self.max_retries)
+        if client._create_chat is None:
+            raise RuntimeError("OpenAI client has no chat completions API")
+        messages = [{"role": "user", "content": prompt}]
+        stream = client._create_chat(
+            model=self._resolve_model(model), messages=messages, max_tokens=max_tokens, stream=True, **kwargs
+        )
+        try:
+            for chunk in stream:
+                # chunks without choices (e.g. a trailing usage chunk) carry no text
+                if chunk.choices:
+                    text = chunk.choices[0].delta.content
+                    if text:
+                        yield text
+        finally:
+            # release the HTTP response (and its pooled connection) even if the
+            # consumer stops early: break, an exception or generator close()
+            stream.close()
+
+    async def generate_stream_async(self, prompt: str, model: str = "minimax/minimax-m2.5", max_tokens: int = 256,
+                                    **kwargs: Any):
+        """Async variant of `generate_stream` using the pooled `AsyncOpenAI` client."""
+        if self.backend != "openai":
+            raise RuntimeError(f"unknown or unsupported backend: {self.backend}")
+        client = _get_async_client(*self._client_args(), self.max_retries)
+        if client._create_chat is None:
+            raise RuntimeError("OpenAI client has no chat completions API")
+        messages = [{"role": "user", "content": prompt}]
+        stream = await client._create_chat(
+            model=self._resolve_model(model), messages=messages, max_tokens=max_tokens, stream=True, **kwargs
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices:
+                    text = chunk.choices[0].delta.content
+                    if text:
+                        yield text
+        finally:
+            await stream.close()
+
+    def specialize(self, **static_params: Any) -> Callable[[List[Dict[str, Any]]], Any]:
+        """Return `call(messages)` with everything but `messages` fixed up front.
+
+        For loops where model, tools, temperature, ... never change: the pooled
+        client and its bound `create` are resolved once and `static_params` frozen
+        (read-only) at specialization time, so each call only passes `messages`.
+        Returns the raw chat completion response (tool calls included).
+        """
+        if "model" in static_params:
+            static_params["model"] = self._resolve_model(static_params["model"])
+        frozen = MappingProxyType(static_params)
+        # the returned closure keeps the pooled client alive even if it is later evicted
+        create = _get_client(*self._client_args(), self.max_retries)._create_chat
+        if create is None:
+            raise RuntimeError("OpenAI client has no chat completions API")
+
+        def call(messages: List[Dict[str, Any]]) -> Any:
+            return create(messages=messages, **frozen)
+
+        return call
+
+    def generate_batch(self, prompts: List[str], model: str = "minimax/minimax-m2.5", max_tokens: int = 1024,
+                       json_mode: bool = True, **kwargs: Any) -> List[str]:
+        """Answer several small prompts with a single request.
+
+        The prompts are sent as one JSON-encoded list and the model is asked for
+        `{"outputs": [...]}` with one answer per input, in order; this saves one
+        round trip (and the repeated instructions) per prompt. `json_mode` adds
+        `response_format={"type": "json_object"}`; turn it off for endpoints that
+        do not support it. Raises RuntimeError if the reply is not such a list.
+        """
+        if not prompts:
+            return []
+        if json_mode:
+            kwargs.setdefault("response_format", {"type": "json_object"})
+        prompt = (
+            "Answer each input in the JSON array below independently. "
+            'Return a JSON object {"outputs": [...]} with exactly one string output per input, in the same order.\n'
+            f"Inputs: {_json_dumps_str(prompts)}"
+        )
+        text = self.generate(prompt, model=model, max_tokens=max_tokens, **kwargs)
+        try:
+            parsed = _json_loads(text)
+        except ValueError as e:
+            raise RuntimeError(f"batch reply is not valid JSON: {text[:200]!r}") from e
+        outputs = parsed.get("outputs") if isinstance(parsed, dict) else parsed
+        if not isinstance(outputs, list) or len(outputs) != len(prompts):
+            raise RuntimeError(f"batch reply does not contain {len(prompts)} outputs: {text[:200]!r}")
+        return [o if isinstance(o, str) else _json_dumps_str(o) for o in outputs]
+
+    # --- offline Batch API ---------------------------------------------------
+    def submit_batch(self, params_list: List[Dict[str, Any]], model: str = "minimax/minimax-m2.5",
+                     completion_window: str = "24h") -> str:
+        """Submit chat completion requests to the OpenAI Batch API; returns the batch id.
+
+        Each item of `params_list` is a chat completion body (`messages`, optional
+        `model`, `max_tokens`, ...). The requests are uploaded as one JSONL file and
+        processed asynchronously by the service (cheaper, higher throughput, up to
+        `completion_window` latency); collect results with `poll_batch`. Results are
+        matched back by `custom_id`, which is `request-<index>`.
+        """
+        client = _get_client(*self._client_args(), self.max_retries)
+        buf = b"".join(
+            _json_dumps_bytes({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model, **params},
+            }) + b"\n"
+            for i, params in enumerate(params_list)
+        )
+        batch_file = client.files.create(file=("batch.jsonl", buf), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,
+        )
+        logger.info("Submitted batch %s with %d requests", batch.id, len(params_list))
+        return batch.id
+
+    def poll_batch(self, batch_id: str, interval: float = 10.0, timeout: Optional[float] = None):
+        """Wait for a batch to finish, then yield each result line as a dict.
+
+        Lines of the output file come first, then those of the error file (requests
+        that failed individually); both carry `custom_id`, and failed ones have a
+        non-null `error` or a non-2xx `response.status_code`. Raises RuntimeError if
+        the batch fails, expires or is cancelled, or if `timeout` seconds pass first.
+        """
+        client = _get_client(*self._client_args(), self.max_retries)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelling", "cancelled"):
+                raise RuntimeError(f"batch {batch_id} ended with status {batch.status}")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise RuntimeError(f"batch {batch_id} not completed within {timeout}s (status {batch.status})")
+            time.sleep(interval)
+        error_file_id = getattr(batch, "error_file_id", None)
+        failed = getattr(getattr(batch, "request_counts", None), "failed", None)
+        if failed:
+            logger.warning("Batch %s: %d of its requests failed (see error file %s)", batch_id, failed, error_file_id)
+        for file_id in (batch.output_file_id, error_file_id):
+            if not file_id:
+                continue
+            raw = client.files.content(file_id).content
+            for line in raw.splitlines():
+                if line.strip():
+                    yield _json_loads(line)
+
+
+def make_specialized_caller(base_params: Dict[str, Any]) -> Callable[[List[Dict[str, Any]]], Any]:
+    """Build a `call(messages)` from a fixed params dict (see `LLMClient.specialize`).
+
+    `api_key` / `base_url` / `max_retries` in `base_params` select the client; all
+    other keys are passed to every chat completion. `base_params` is not modified.
+    """
+    params = dict(base_params)
+    client = LLMClient(
+        api_key=params.pop("api_key", None),
+        endpoint=params.pop("base_url", None),
+        max_retries=params.pop("max_retries", DEFAULT_MAX_RETRIES),
+    )
+    return client.specialize(**params)
+
 
-def create_client(backend: str = "openai", api_key: Optional[str] = None, endpoint: Optional[str] = None) -> LLMClient:
+def create_client(backend: str = "openai", api_key: Optional[str] = None, endpoint: Optional[str] = None,
+                  max_retries: int = DEFAULT_MAX_RETRIES) -> LLMClient:
     """Factory convenience to create an `LLMClient`."""
-    return LLMClient(backend=backend, api_key=api_key, endpoint=endpoint)
+    return LLMClient(backend=backend, api_key=api_key, endpoint=endpoint, max_retries=max_retries)
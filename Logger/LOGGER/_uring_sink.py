@@ -0,0 +1,165 @@
+"""io_uring backed variant of `FileSink` (Linux only, optional).
+
+需要 `liburing` 包（PyPI）及支持 io_uring 的内核；不可用时 `create_uring_sink`
+返回 None，由 `get_sink` 回退到默认的缓冲写入实现。
+
+每批记录在同一个 ring 上提交：每条记录一个 `IORING_OP_WRITE`，末尾追加一个
+`IORING_OP_FSYNC`，各 SQE 以 `IOSQE_IO_LINK` 串联以保证顺序，整批只调用一次
+`io_uring_submit`（必要时重复提交直至全部提交），随后回收全部 CQE 并检查 `res`：
+失败、被取消或短写的记录及其后续记录改用普通 `write` 补写。ring 出现不可恢复的错误时，
+该 sink 之后改走缓冲写入路径。
+"""
+from __future__ import annotations
+
+import errno
+import os
+import sys
+from typing import Dict, List, Optional
+
+from .file_sink import FileSink, _write_all
+
+try:
+    import liburing  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    liburing = None  # type: ignore
+
+RING_ENTRIES = 256
+# 单批 SQE 数上限（含末尾的 fsync）
+URING_BATCH_MAX = 64
+# transient errors from io_uring_submit / io_uring_wait_cqe that are retried
+_RETRY_ERRNOS = frozenset({errno.EINTR, errno.EAGAIN, errno.EBUSY})
+# consecutive submits without progress (nothing in flight) before giving up on the ring
+_MAX_SUBMIT_STALLS = 100
+
+
+def _rc(fn, *args) -> int:
+    """Call a liburing function and return its C-style result.
+
+    Depending on the binding, errors come back as a negative errno or are raised as
+    `OSError`; the latter is mapped to `-errno` so both take the same path.
+    """
+    try:
+        return fn(*args) or 0
+    except OSError as e:
+        return -(e.errno or errno.EIO)
+
+
+class UringFileSink(FileSink):
+    """`FileSink` that submits batched writes through io_uring."""
+
+    def __init__(self, path: str, **kwargs):
+        kwargs.setdefault("batch_max", URING_BATCH_MAX - 1)
+        super().__init__(path, **kwargs)
+
+    def _open(self) -> None:
+        self._broken = False
+        self._abandoned: List[List[bytes]] = []
+        self._ring = liburing.io_uring()
+        self._cqe = liburing.io_uring_cqe()
+        rc = _rc(liburing.io_uring_queue_init, RING_ENTRIES, self._ring, 0)
+        if rc < 0:
+            raise OSError(-rc, os.strerror(-rc))
+        try:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except Exception:
+            liburing.io_uring_queue_exit(self._ring)
+            raise
+
+    def _write_batch(self, lines: List[bytes]) -> None:
+        if self._broken:
+            return super()._write_batch(lines)
+        ring = self._ring
+        fd = self._fd
+        # `lines` keeps the buffers referenced until their completions are reaped
+        for i, buf in enumerate(lines):
+            sqe = liburing.io_uring_get_sqe(ring)
+            # O_APPEND makes the kernel ignore the offset and append
+            liburing.io_uring_prep_write(sqe, fd, buf, len(buf), 0)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_fsync(sqe, fd, 0)
+        liburing.io_uring_sqe_set_data64(sqe, len(lines))
+
+        results = self._submit_and_reap(lines, len(lines) + 1)
+
+        # first write that did not complete in full (error, -ECANCELED after a
+        # failed link, short write, or never submitted): finish it and the rest
+        # with plain writes, in order
+        for i, buf in enumerate(lines):
+            res = results.get(i)
+            if res != len(buf):
+                done = res if res is not None and res > 0 else 0
+                _write_all(fd, b"".join([buf[done:], *lines[i + 1:]]))
+                break
+        else:
+            if results.get(len(lines)) == 0:
+                return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+
+    def _submit_and_reap(self, lines: List[bytes], queued: int) -> Dict[int, int]:
+        """Submit `queued` prepared SQEs and wait for their CQEs; returns user_data -> res.
+
+        Entries missing from the result did not complete through the ring. If the
+        ring fails hard, the sink switches to plain writes for good (`_broken`).
+        """
+        ring = self._ring
+        cqe = self._cqe
+        results: Dict[int, int] = {}
+        submitted = 0
+        stalls = 0
+        while True:
+            if submitted < queued and not self._broken:
+                rc = _rc(liburing.io_uring_submit, ring)
+                if rc > 0:
+                    submitted += rc
+                    stalls = 0
+                elif rc == 0 or -rc in _RETRY_ERRNOS:
+                    stalls += 1
+                    if stalls > _MAX_SUBMIT_STALLS and len(results) == submitted:
+                        self._broken = True
+                else:
+                    self._broken = True
+            if len(results) < submitted:
+                rc = _rc(liburing.io_uring_wait_cqe, ring, cqe)
+                if rc < 0:
+                    if -rc in _RETRY_ERRNOS:
+                        continue
+                    # completions can no longer be reaped: keep the buffers of the
+                    # in-flight writes alive and stop using the ring
+                    self._broken = True
+                    self._abandoned.append(lines)
+                    return results
+                results[liburing.io_uring_cqe_get_data64(cqe)] = cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+            elif submitted >= queued or self._broken:
+                # SQEs never submitted stay in the ring; once `_broken` it is
+                # never submitted again, so they are simply abandoned
+                return results
+
+    def _close(self) -> None:
+        try:
+            os.close(self._fd)
+        except Exception:
+            pass
+        try:
+            liburing.io_uring_queue_exit(self._ring)
+        except Exception:
+            pass
+
+
+def create_uring_sink(path: str) -> Optional[UringFileSink]:
+    """Return a `UringFileSink` for `path`, or None if io_uring is unavailable."""
+    if liburing is None or not sys.platform.startswith("linux"):
+        return None
+    try:
+        return UringFileSink(path)
+    except Exception:
+        # kernel without io_uring support, seccomp restrictions, etc.
+        return None
+
+
+__all__ = ["UringFileSink", "create_uring_sink"]
@@ -0,0 +1,235 @@
+"""Background batched append sink shared by the JSONL / TXT writers.
+
+功能：
+- 调用方线程只把已编码好的行（bytes）放入队列（非阻塞），不再每条记录 open/write/close。
+- 后台守护线程常驻持有文件描述符，把队列中积压的行用一次 `os.writev` 聚合写入，并在每批之后 fsync。
+- 同一路径只创建一个 sink（`get_sink`），避免多个写入器各自持有句柄导致交错写入。
+- `io_backend="uring"` 在 Linux 上改用 io_uring 批量提交（见 `_uring_sink`），不可用时回退。
+- 进程退出时（atexit）排空队列并关闭文件；`flush()` 可显式等待已入队的记录落盘。
+- fork 安全：子进程继承的 sink 没有写线程，首次写入时在子进程内重新打开文件并启动写线程
+  （父进程队列中尚未写出的行仍由父进程负责，子进程不会重复写）。
+- 队列满时最多阻塞 `put_timeout` 秒，超时则丢弃该行并计入 `dropped`，写线程异常也不会卡死调用方。
+
+用法示例：
+    sink = get_sink("Logs/logs.jsonl")
+    sink.write(b'{"level":"INFO"}\\n')
+    sink.flush()
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import threading
+from typing import Dict, List, Optional
+
+# 单批最多合并的记录数
+DEFAULT_BATCH_MAX = 512
+# 队列容量；写满时调用方阻塞等待（背压）
+DEFAULT_QUEUE_SIZE = 10000
+# 队列满时的最长等待秒数，超时后丢弃该行（计入 `FileSink.dropped`）
+DEFAULT_PUT_TIMEOUT = 1.0
+
+_STOP = object()
+
+# os.writev is POSIX only
+_writev = getattr(os, "writev", None)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+
+class FileSink:
+    """Append-only file sink drained by a daemon writer thread.
+
+    Params:
+        path: 目标文件路径（父目录需已存在）。
+        maxsize: 队列容量。
+        batch_max: 单次写入最多合并的记录数。
+        put_timeout: 队列满时的最长等待秒数，超时丢弃该行。
+    """
+
+    def __init__(self, path: str, maxsize: int = DEFAULT_QUEUE_SIZE, batch_max: int = DEFAULT_BATCH_MAX,
+                 put_timeout: float = DEFAULT_PUT_TIMEOUT):
+        self.path = path
+        self.batch_max = batch_max
+        self.put_timeout = put_timeout
+        # lines dropped because the queue stayed full for `put_timeout`
+        self.dropped = 0
+        self._maxsize = maxsize
+        self._closed = False
+        # set in a forked child (see `_after_fork_in_child`): the writer thread
+        # did not survive fork(), so the sink is restarted on first use
+        self._forked = False
+        self._restart_lock = threading.Lock()
+        self._start()
+
+    def _start(self) -> None:
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=self._maxsize)
+        self._open()
+        self._thread = threading.Thread(target=self._writer_loop, name=f"FileSink:{os.path.basename(self.path)}", daemon=True)
+        self._thread.start()
+
+    def _restart_in_child(self) -> None:
+        with self._restart_lock:
+            if not self._forked:
+                return
+            # drop the inherited descriptor/ring and the parent's queue: lines the
+            # parent had queued are written by the parent, not duplicated here
+            self._close()
+            self._start()
+            self._forked = False
+
+    def _after_fork_in_child(self) -> None:
+        # locks may have been held by other parent threads at fork time
+        self._restart_lock = threading.Lock()
+        self._forked = True
+
+    # --- backend hooks -------------------------------------------------
+    def _open(self) -> None:
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _write_batch(self, lines: List[bytes]) -> None:
+        fd = self._fd
+        if _writev is not None:
+            # one gathered write syscall for the whole batch
+            written = _writev(fd, lines)
+            total = sum(map(len, lines))
+            if written < total:
+                _write_all(fd, b"".join(lines)[written:])
+        else:
+            _write_all(fd, b"".join(lines))
+        try:
+            os.fsync(fd)
+        except OSError:
+            # platform may not support fsync on some streams; ignore
+            pass
+
+    def _close(self) -> None:
+        try:
+            os.close(self._fd)
+        except Exception:
+            pass
+
+    # --- public API ----------------------------------------------------
+    def write(self, line: bytes) -> None:
+        """Enqueue an already encoded line (including trailing newline)."""
+        if self._closed:
+            return
+        if self._forked:
+            self._restart_in_child()
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            try:
+                self._queue.put(line, timeout=self.put_timeout)
+            except queue.Full:
+                self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until every line enqueued so far has been written."""
+        if not self._forked and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain pending lines, stop the writer thread and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._forked:
+            # inherited across fork() and never written to here: nothing to drain
+            self._close()
+            return
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    # --- writer thread -------------------------------------------------
+    def _writer_loop(self) -> None:
+        q = self._queue
+        stop = False
+        while not stop:
+            item = q.get()
+            batch: List[bytes] = []
+            taken = 1
+            if item is _STOP:
+                stop = True
+            else:
+                batch.append(item)  # type: ignore[arg-type]
+            # 排空当前积压（不等待），合并为一次写入
+            while not stop and len(batch) < self.batch_max:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)  # type: ignore[arg-type]
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:
+                    # swallow write errors to avoid killing the writer thread
+                    pass
+            for _ in range(taken):
+                q.task_done()
+        self._close()
+
+
+_sinks: Dict[str, FileSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_sink(path: str, io_backend: str = "buffered") -> FileSink:
+    """Return the shared sink for `path`, creating it on first use.
+
+    `io_backend` only applies when the sink is created: "buffered" (default) or
+    "uring" (falls back to "buffered" when io_uring is unavailable).
+    """
+    key = os.path.abspath(path)
+    sink = _sinks.get(key)
+    if sink is not None:
+        return sink
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None:
+            if io_backend == "uring":
+                from ._uring_sink import create_uring_sink
+                sink = create_uring_sink(key)
+            if sink is None:
+                sink = FileSink(key)
+            _sinks[key] = sink
+        return sink
+
+
+def _after_fork_in_child() -> None:
+    global _sinks_lock
+    _sinks_lock = threading.Lock()
+    for s in list(_sinks.values()):
+        s._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+@atexit.register
+def _close_all_sinks() -> None:
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+    for s in sinks:
+        s.close()
+
+
+__all__ = ["FileSink", "get_sink"]
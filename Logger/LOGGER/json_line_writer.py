@@ -1,9 +1,11 @@
 """JSON Lines writer for log records.
 
 功能：
-- 将字典记录作为单行 JSON 追加到文件(NDJSON/JSONL)。
+- 将字典记录作为单行 JSON 追加到文件(NDJSON/JSONL)；安装了 `orjson` 时用其序列化，否则回退标准库 `json`。
+  orjson 不支持的值(超过 64 位的整数)自动交给标准库；注意 orjson 把 NaN/Infinity 写为 `null`
+  (合法 JSON)，标准库则写出非标准的 `NaN`/`Infinity` 字面量。
 - 自动补 timestamp(UTC ISO8601)和 level(默认 INFO)字段（若缺失）。
-- 线程安全，写入后 flush 并 fsync 保证落盘。
+- 线程安全：记录在调用方线程序列化后交给后台 `FileSink` 批量追加写入，每批 flush + fsync。
 
 用法示例：
     writer = JSONLineWriter()
@@ -13,11 +15,24 @@ from __future__ import annotations
 
 import json
 import os
-import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from Logger import RecordMustBeDict, RecordNotJSONSerializable
 
+from .file_sink import get_sink
+
+try:
+    # optional fast serializer: returns UTF-8 bytes directly
+    import orjson
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+except Exception:
+    orjson = None  # type: ignore
+
+
+def _stdlib_dumps(r: Dict[str, Any]) -> Tuple[str, bytes]:
+    line = json.dumps(r, ensure_ascii=False, separators=(',', ':'))
+    return line, (line + '\n').encode('utf-8')
+
 
 def _default_log_path() -> str:
     base = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -30,17 +45,21 @@ class JSONLineWriter:
     Params:
         path: 输出文件路径，默认 `Logs/logs.jsonl` 相对于仓库根。
         ensure_dir: 若目标目录不存在则创建(默认 True)。
+        io_backend: 文件写入后端，"buffered"(默认) 或 "uring"(Linux io_uring，不可用时回退)。
     """
 
-    def __init__(self, path: Optional[str] = None, ensure_dir: bool = True):
+    def __init__(self, path: Optional[str] = None, ensure_dir: bool = True, io_backend: str = "buffered"):
         self.path = path or _default_log_path()
-        self._lock = threading.Lock()
         if ensure_dir:
             d = os.path.dirname(self.path)
             if d and not os.path.exists(d):
                 os.makedirs(d, exist_ok=True)
+        self._sink = get_sink(self.path, io_backend=io_backend)
 
     def _prepare_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        # records from `Logger` already carry both fields: serialize them as-is
+        if 'timestamp' in record and 'level' in record:
+            return record
         # copy to avoid mutating caller dict
         r = dict(record)
         if 'timestamp' not in r:
@@ -60,34 +79,30 @@ class JSONLineWriter:
 
         r = self._prepare_record(record)
 
-        # Serialize to a single-line JSON string
+        # Serialize to a single-line JSON string (bytes for the sink)
         try:
-            line = json.dumps(r, ensure_ascii=False, separators=(',', ':'))
+            if orjson is not None:
+                try:
+                    data = orjson.dumps(r, option=_ORJSON_OPTS)
+                    line = data[:-1].decode('utf-8')
+                except orjson.JSONEncodeError:
+                    # e.g. ints beyond 64 bits: the stdlib can still encode them
+                    line, data = _stdlib_dumps(r)
+            else:
+                line, data = _stdlib_dumps(r)
         except TypeError as e:
-            # attempt to provide a helpful message
+            # attempt to provide a helpful message (orjson.JSONEncodeError is a TypeError)
             raise RecordNotJSONSerializable(str(e)) from e
 
-        # Append newline
-        line_to_write = line + '\n'
-
-        # Thread-safe append with flush + fsync
-        with self._lock:
-            # open in append and binary to ensure fsync works predictably
-            with open(self.path, 'a', encoding='utf-8') as f:
-                f.write(line_to_write)
-                try:
-                    f.flush()
-                except Exception:
-                    pass
-                try:
-                    fd = f.fileno()
-                    os.fsync(fd)
-                except Exception:
-                    # platform may not support fsync on some streams; ignore
-                    pass
+        # Hand off to the background writer (batched append + fsync)
+        self._sink.write(data)
 
         return line
 
+    def flush(self) -> None:
+        """Block until all records written so far have reached the file."""
+        self._sink.flush()
+
 
 def default_writer() -> JSONLineWriter:
     return JSONLineWriter()
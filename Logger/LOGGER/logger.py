@@ -6,12 +6,16 @@ from __future__ import annotations
 
 import socket
 import os
+from collections import OrderedDict
+import sys
+import threading
+import time
 import traceback
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .json_line_writer import JSONLineWriter
 from .txt_writer import TextWriter
-from .printer import Printer
+from .printer import Printer, LEVELS
 
 try:
     # import OriflowError if available
@@ -24,9 +28,45 @@ def _default_logger_name() -> str:
     return "Oriflow"
 
 
+# level name (upper and lower case) -> priority (higher is more severe);
+# unknown levels rank as INFO
+_LEVEL_PRIORITY: Dict[str, int] = {}
+for _i, _lvl in enumerate(LEVELS):
+    _LEVEL_PRIORITY[_lvl] = _LEVEL_PRIORITY[_lvl.lower()] = _i
+_DEFAULT_PRIORITY = _LEVEL_PRIORITY["INFO"]
+
+
+def _level_priority(level: Optional[str]) -> int:
+    p = _LEVEL_PRIORITY.get(level) if level else _DEFAULT_PRIORITY
+    if p is None:
+        p = _LEVEL_PRIORITY.get(level.upper(), _DEFAULT_PRIORITY)
+    return p
+
+
+# max distinct (level, code, message) keys remembered for duplicate suppression
+_DEDUP_MAX_KEYS = 4096
+
+
+def _utc_timestamp() -> str:
+    """UTC ISO8601 timestamp with millisecond precision, e.g. 2026-02-26T16:00:00.123+00:00."""
+    # derive seconds and milliseconds from one value so they cannot straddle a second
+    ms = int(time.time() * 1000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ms // 1000)) + ".%03d+00:00" % (ms % 1000)
+
+
 class Logger:
     """Simple logger facade routing to JSONL/TXT and optional console.
 
+    Records below `min_level` (DEBUG < INFO < WARNING < ERROR < CRITICAL) are
+    dropped before any formatting work is done.
+
+    `log()` drops a record identical (same level, code and message, no ctx) to
+    one logged less than `dedup_window` seconds earlier; 0 disables this.
+    Records carrying `ctx` are never deduplicated.
+
+    `io_backend` selects the file sink: "buffered" (default) or "uring"
+    (Linux io_uring, falls back to "buffered" when unavailable).
+
     Example:
         lg = Logger()
         lg.log('INFO', 'started')
@@ -37,13 +77,34 @@ class Logger:
                  name: Optional[str] = None,
                  json_path: Optional[str] = None,
                  txt_path: Optional[str] = None,
-                 to_console: bool = True):
+                 to_console: bool = True,
+                 io_backend: str = "buffered",
+                 min_level: str = "DEBUG",
+                 dedup_window: float = 1.0):
         self.name = name or _default_logger_name()
-        self.json_writer = JSONLineWriter(path=json_path) if json_path is not None else JSONLineWriter()
-        self.txt_writer = TextWriter(path=txt_path) if txt_path is not None else TextWriter()
+        self.json_writer = JSONLineWriter(path=json_path, io_backend=io_backend)
+        self.txt_writer = TextWriter(path=txt_path, io_backend=io_backend)
         self.printer = Printer() if to_console else None
         self.host = socket.gethostname()
         self.pid = os.getpid()
+        self.min_level = min_level
+        self.dedup_window = dedup_window
+        self._dedup: "OrderedDict[Tuple[str, Optional[int], str], float]" = OrderedDict()
+        self._dedup_lock = threading.Lock()
+
+    @property
+    def min_level(self) -> str:
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, level: str) -> None:
+        lvl = level.upper() if level else 'DEBUG'
+        self._min_level = lvl
+        self._min_priority = _level_priority(lvl)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Return True if a record at `level` would be emitted."""
+        return _level_priority(level) >= self._min_priority
 
     def _make_base_record(self, level: str, message: str, code: Optional[int] = None, ctx: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         rec: Dict[str, Any] = {
@@ -57,9 +118,32 @@ class Logger:
             rec['code'] = code
         if ctx is not None:
             rec['ctx'] = ctx
+        # one timestamp shared by the JSONL and TXT writers
+        rec['timestamp'] = _utc_timestamp()
         return rec
 
+    def _is_duplicate(self, level: str, code: Optional[int], message: str) -> bool:
+        """True if the same (level, code, message) was emitted within `dedup_window`."""
+        key = (level.upper() if level else 'INFO', code, message)
+        now = time.monotonic()
+        dedup = self._dedup
+        with self._dedup_lock:
+            last = dedup.get(key)
+            if last is not None and now - last < self.dedup_window:
+                return True
+            # 仅在真正写出时刷新时间戳：持续重复的消息每个窗口仍输出一次
+            dedup[key] = now
+            dedup.move_to_end(key)
+            if len(dedup) > _DEDUP_MAX_KEYS:
+                dedup.popitem(last=False)
+        return False
+
     def log(self, level: str, message: str, code: Optional[int] = None, ctx: Optional[Dict[str, Any]] = None) -> None:
+        if not self.is_enabled_for(level):
+            return
+        # records with ctx differ in content (e.g. per-node ids), so only bare ones are deduplicated
+        if ctx is None and self.dedup_window > 0 and self._is_duplicate(level, code, message):
+            return
         rec = self._make_base_record(level, message, code=code, ctx=ctx)
         # write to backends
         try:
@@ -78,21 +162,33 @@ class Logger:
             except Exception:
                 pass
 
-    def error(self, exc: Exception, ctx: Optional[Dict[str, Any]] = None) -> None:
-        """Log an exception object. Supports OriflowError specially."""
+    def error(self, exc: Exception, ctx: Optional[Dict[str, Any]] = None, message: Optional[str] = None) -> None:
+        """Log an exception object. Supports OriflowError specially.
+
+        `message` 若给出，作为前缀写入记录：`"{message}: {异常消息}"`。
+        """
         if OriflowError is not None and isinstance(exc, OriflowError):
             # extract fields from OriflowError
             level = exc.level.value if getattr(exc, 'level', None) is not None else 'ERROR'
-            message = getattr(exc, 'message', str(exc))
+            if not self.is_enabled_for(level):
+                return
+            text = getattr(exc, 'message', str(exc))
+            if message:
+                text = f"{message}: {text}"
             code = getattr(exc, 'code', None)
-            rec = self._make_base_record(level, message, code=code, ctx=ctx)
+            rec = self._make_base_record(level, text, code=code, ctx=ctx)
             # include repr
             rec['error_type'] = exc.__class__.__name__
         else:
-            # generic exception: include stack
-            tb = ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
-            rec = self._make_base_record('ERROR', str(exc), ctx=ctx)
-            rec['stack'] = tb
+            if not self.is_enabled_for('ERROR'):
+                return
+            text = f"{message}: {exc}" if message else str(exc)
+            rec = self._make_base_record('ERROR', text, ctx=ctx)
+            # generic exception: include stack, but only if it was actually raised
+            # (an exception object that never propagated has no frames to format)
+            tb = getattr(exc, '__traceback__', None)
+            if tb is not None:
+                rec['stack'] = ''.join(traceback.format_exception(type(exc), exc, tb))
 
         try:
             self.json_writer.write(rec)
@@ -112,21 +208,44 @@ class Logger:
             except Exception:
                 pass
 
+    def flush(self) -> None:
+        """Block until all queued records have been written to the JSONL/TXT files."""
+        self.json_writer.flush()
+        self.txt_writer.flush()
+
     def exception(self, message: str, ctx: Optional[Dict[str, Any]] = None) -> None:
         """Convenience to log current exception with a message (like logging.exception)."""
-        try:
-            raise
-        except Exception as e:
-            # attach message
-            full_msg = f"{message}: {e}"
-            self.error(e, ctx=ctx)
+        # read the exception being handled directly instead of re-raising it
+        exc = sys.exc_info()[1]
+        if exc is None:
+            self.log('ERROR', message, ctx=ctx)
+            return
+        self.error(exc, ctx=ctx, message=message)
 
 
-_default_logger = Logger()
+# created on first use so importing the package does not open log files or
+# start writer threads
+_default_logger_instance: Optional[Logger] = None
+_default_logger_lock = threading.Lock()
 
 
 def get_logger() -> Logger:
-    return _default_logger
+    """Return the process-wide default Logger, creating it on first use (thread-safe)."""
+    global _default_logger_instance
+    lg = _default_logger_instance
+    if lg is not None:
+        return lg
+    with _default_logger_lock:
+        if _default_logger_instance is None:
+            _default_logger_instance = Logger()
+        return _default_logger_instance
+
+
+def __getattr__(name: str) -> Any:
+    # keep `_default_logger` importable; it now resolves lazily via get_logger()
+    if name == "_default_logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["Logger", "get_logger", "_default_logger"]
@@ -3,7 +3,8 @@
 Features:
 - Levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
 - Timestamped output
-- Colorized output using `console_color` when enabled
+- Colorized output using `console_color` when enabled and the stream is a terminal
+  (redirected/piped output is written plain, skipping all color work)
 - Thread-safe simple print using a lock
 """
 from __future__ import annotations
@@ -17,6 +18,46 @@ from .console_color import color, GET_COLOR
 
 LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+# accepted spellings (upper/lower case, e.g. `SeverityLevel` values) -> canonical level
+LEVEL_ALIASES: Dict[str, str] = {**{lvl: lvl for lvl in LEVELS}, **{lvl.lower(): lvl for lvl in LEVELS}}
+
+
+def normalize_level(level: Optional[str]) -> str:
+    """Map a level name to one of `LEVELS`; unknown or empty levels become INFO."""
+    lvl = LEVEL_ALIASES.get(level) if level else "INFO"
+    if lvl is None:
+        lvl = LEVEL_ALIASES.get(level.upper(), "INFO")
+    return lvl
+
+# default color mapping per level
+DEFAULT_COLOR_MAP: Dict[str, str] = {
+    "DEBUG": GET_COLOR.BRIGHT_BLUE,
+    "INFO": GET_COLOR.GREEN,
+    "WARNING": GET_COLOR.YELLOW,
+    "ERROR": GET_COLOR.RED,
+    "CRITICAL": GET_COLOR.BRIGHT_RED,
+}
+
+
+def _stream_supports_color(stream) -> bool:
+    """ANSI colors are only worth emitting when the stream is an interactive terminal."""
+    try:
+        return bool(stream.isatty())
+    except Exception:
+        return False
+
+
+# sys.stdout at import time and whether it is a terminal: probed once, reused by
+# every Printer writing to it (one per Logger) instead of isatty() per instance
+_STDOUT = sys.stdout
+_STDOUT_SUPPORTS_COLOR = _stream_supports_color(_STDOUT)
+
+
+def _supports_color(stream) -> bool:
+    if stream is _STDOUT:
+        return _STDOUT_SUPPORTS_COLOR
+    return _stream_supports_color(stream)
+
 
 class Printer:
     """
@@ -27,19 +68,38 @@ class Printer:
     def __init__(self, out_stream=None, colorize: bool = True, color_map: Optional[Dict[str, str]] = None):
         self.out = out_stream or sys.stdout
         self._lock = threading.Lock()
-        self.colorize = colorize
-        # default color mapping per level
-        default_map = {
-            "DEBUG": GET_COLOR.BRIGHT_BLUE,
-            "INFO": GET_COLOR.GREEN,
-            "WARNING": GET_COLOR.YELLOW,
-            "ERROR": GET_COLOR.RED,
-            "CRITICAL": GET_COLOR.BRIGHT_RED,
+        self.color_map = {**DEFAULT_COLOR_MAP, **(color_map or {})}
+        # level -> colored "[LEVEL]" token, built once instead of per line
+        self._level_prefix: Dict[str, str] = {
+            lvl: color(f"[{lvl}]", code) for lvl, code in self.color_map.items() if code
         }
-        self.color_map = {**default_map, **(color_map or {})}
+        self.colorize = colorize
 
-    def _format(self, message: str, level: str) -> str:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    @property
+    def colorize(self) -> bool:
+        return self._colorize
+
+    @colorize.setter
+    def colorize(self, value: bool) -> None:
+        # pick the output path once instead of re-checking color support per line
+        self._colorize = bool(value)
+        use_color = self._colorize and _supports_color(self.out)
+        self._emit = self._emit_color if use_color else self._emit_plain
+
+    def _emit_color(self, now: str, lvl: str, message: str, text: str, end: str) -> None:
+        prefix = self._level_prefix.get(lvl)
+        if prefix is not None:
+            # Only color the level bracket, e.g. [INFO]
+            self.out.write(f"[{now}] {prefix} {message}{end}")
+        else:
+            self.out.write(text + end)
+
+    def _emit_plain(self, now: str, lvl: str, message: str, text: str, end: str) -> None:
+        self.out.write(text + end)
+
+    def _format(self, message: str, level: str, now: Optional[str] = None) -> str:
+        if now is None:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         lvl = level.upper() if level else "INFO"
         return f"[{now}] [{lvl}] {message}"
 
@@ -47,29 +107,16 @@ class Printer:
         """
         Print a formatted message. Returns the raw formatted string (without ANSI colors).
         """
-        lvl = level.upper() if level else "INFO"
-        if lvl not in LEVELS:
-            lvl = "INFO"
+        lvl = normalize_level(level)
 
         # Raw text (returned, without ANSI color codes)
-        text = self._format(message, lvl)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        text = self._format(message, lvl, now)
 
         # Build colored output for the stream, but keep returned `text` unmodified
         with self._lock:
             try:
-                if self.colorize:
-                    color_code = self.color_map.get(lvl)
-                    if color_code:
-                        # Only color the level bracket, e.g. [INFO]
-                        level_token = f"[{lvl}]"
-                        colored_level = color(level_token, color_code)
-                        # Replace the first occurrence of the level token in the formatted text
-                        colored_text = text.replace(level_token, colored_level, 1)
-                        self.out.write(colored_text + end)
-                    else:
-                        self.out.write(text + end)
-                else:
-                    self.out.write(text + end)
+                self._emit(now, lvl, message, text, end)
                 self.out.flush()
             except Exception:
                 # best-effort: ignore write/flush errors
@@ -90,5 +137,5 @@ def print_msg(message: str, level: str = "INFO") -> str:
     return _default_printer.print(message, level=level)
 
 
-__all__ = ["Printer", "print_msg"]
+__all__ = ["Printer", "print_msg", "normalize_level"]
 
@@ -10,12 +10,13 @@ Example line:
 from __future__ import annotations
 
 import os
-import threading
 import json
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from Logger import RecordMustBeDict
 
+from .file_sink import get_sink
+
 
 def _default_txt_path() -> str:
     base = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -28,15 +29,16 @@ class TextWriter:
     Parameters:
         path: output file path (default Logs/logs.txt)
         ensure_dir: create parent dir if missing
+        io_backend: "buffered" (default) or "uring" (Linux io_uring, falls back when unavailable)
     """
 
-    def __init__(self, path: Optional[str] = None, ensure_dir: bool = True):
+    def __init__(self, path: Optional[str] = None, ensure_dir: bool = True, io_backend: str = "buffered"):
         self.path = path or _default_txt_path()
-        self._lock = threading.Lock()
         if ensure_dir:
             d = os.path.dirname(self.path)
             if d and not os.path.exists(d):
                 os.makedirs(d, exist_ok=True)
+        self._sink = get_sink(self.path, io_backend=io_backend)
 
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
@@ -66,23 +68,14 @@ class TextWriter:
 
         line = self._format(record)
 
-        line_to_write = line + '\n'
-
-        with self._lock:
-            with open(self.path, 'a', encoding='utf-8') as f:
-                f.write(line_to_write)
-                try:
-                    f.flush()
-                except Exception:
-                    pass
-                try:
-                    fd = f.fileno()
-                    os.fsync(fd)
-                except Exception:
-                    pass
+        self._sink.write((line + '\n').encode('utf-8'))
 
         return line
 
+    def flush(self) -> None:
+        """Block until all lines written so far have reached the file."""
+        self._sink.flush()
+
 
 def default_writer() -> TextWriter:
     return TextWriter()
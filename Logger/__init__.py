@@ -80,10 +80,21 @@ __all__ = [
     "PluginInstantiateError",
 ]
 
-from .LOGGER.logger import Logger, get_logger, _default_logger
+from .LOGGER.logger import Logger, get_logger
 
 # append exports instead of replacing __all__
 __all__.append("Logger")
 __all__.append("get_logger")
 __all__.append("_default_logger")
 
+
+def __getattr__(name):
+    # `_default_logger` is created lazily on first access (see `get_logger`)
+    if name == "_default_logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+from .errors.error_table import ErrorInfo, get_error_info
+
+__all__.append("ErrorInfo")
+__all__.append("get_error_info")
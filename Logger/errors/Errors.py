@@ -121,14 +121,18 @@ __all__ = [
 ]
 
 
-#809
-class NodePayloadValidationError(OriflowError):
-    DEFAULT_CODE = 809
+class _ValidationFailedError(OriflowError):
+    """校验失败类错误的公共基类：携带可选的 pydantic `ValidationError`，
+    `to_dict` 时附带其 `errors()` 明细。子类只需给出 DEFAULT_CODE / DEFAULT_MESSAGE。
+    """
+
+    DEFAULT_CODE: int
+    DEFAULT_MESSAGE: str
 
     def __init__(self, message: Optional[str] = None, code: Optional[int] = None,
                  level: Optional[SeverityLevel] = None, validation_error: Optional[ValidationError] = None):
         if message is None:
-            message = "NodePayload validation failed"
+            message = self.DEFAULT_MESSAGE
         super().__init__(message, code or self.DEFAULT_CODE, level)
         self.validation_error: Optional[ValidationError] = validation_error
 
@@ -142,67 +146,28 @@ class NodePayloadValidationError(OriflowError):
         return base
 
 
-#810
-class WorkflowPayloadValidationError(OriflowError):
-    DEFAULT_CODE = 810
+#809
+class NodePayloadValidationError(_ValidationFailedError):
+    DEFAULT_CODE = 809
+    DEFAULT_MESSAGE = "NodePayload validation failed"
 
-    def __init__(self, message: Optional[str] = None, code: Optional[int] = None,
-                 level: Optional[SeverityLevel] = None, validation_error: Optional[ValidationError] = None):
-        if message is None:
-            message = "WorkflowPayload validation failed"
-        super().__init__(message, code or self.DEFAULT_CODE, level)
-        self.validation_error: Optional[ValidationError] = validation_error
 
-    def to_dict(self):
-        base = super().to_dict()
-        if self.validation_error is not None:
-            try:
-                base["validation_errors"] = self.validation_error.errors()
-            except Exception:
-                base["validation_errors"] = str(self.validation_error)
-        return base
+#810
+class WorkflowPayloadValidationError(_ValidationFailedError):
+    DEFAULT_CODE = 810
+    DEFAULT_MESSAGE = "WorkflowPayload validation failed"
 
 
 #811
-class NodeDictValidationError(OriflowError):
+class NodeDictValidationError(_ValidationFailedError):
     DEFAULT_CODE = 811
-
-    def __init__(self, message: Optional[str] = None, code: Optional[int] = None,
-                 level: Optional[SeverityLevel] = None, validation_error: Optional[ValidationError] = None):
-        if message is None:
-            message = "Node dict validation failed"
-        super().__init__(message, code or self.DEFAULT_CODE, level)
-        self.validation_error: Optional[ValidationError] = validation_error
-
-    def to_dict(self):
-        base = super().to_dict()
-        if self.validation_error is not None:
-            try:
-                base["validation_errors"] = self.validation_error.errors()
-            except Exception:
-                base["validation_errors"] = str(self.validation_error)
-        return base
+    DEFAULT_MESSAGE = "Node dict validation failed"
 
 
 #812
-class WorkflowDictValidationError(OriflowError):
+class WorkflowDictValidationError(_ValidationFailedError):
     DEFAULT_CODE = 812
-
-    def __init__(self, message: Optional[str] = None, code: Optional[int] = None,
-                 level: Optional[SeverityLevel] = None, validation_error: Optional[ValidationError] = None):
-        if message is None:
-            message = "Workflow dict validation failed"
-        super().__init__(message, code or self.DEFAULT_CODE, level)
-        self.validation_error: Optional[ValidationError] = validation_error
-
-    def to_dict(self):
-        base = super().to_dict()
-        if self.validation_error is not None:
-            try:
-                base["validation_errors"] = self.validation_error.errors()
-            except Exception:
-                base["validation_errors"] = str(self.validation_error)
-        return base
+    DEFAULT_MESSAGE = "Workflow dict validation failed"
 
 
 __all__.extend([
@@ -0,0 +1,72 @@
+"""错误码静态表。
+
+首次调用 `get_error_info`（或访问 `ERROR_TABLE`）时读取一次 `Errorlists.json`，
+展平为 `code -> ErrorInfo` 的字典，之后按错误码查询只需一次 dict 查找；
+导入本模块不读文件。
+"""
+import json
+import os
+import threading
+from typing import Dict, NamedTuple, Optional
+
+
+class ErrorInfo(NamedTuple):
+    name: str
+    category: str
+    default_level: str
+    message: str
+
+
+def _errorlists_path() -> str:
+    return os.path.join(os.path.dirname(__file__), 'Errorlists.json')
+
+
+def _load_error_table(path: str) -> Dict[int, ErrorInfo]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    table: Dict[int, ErrorInfo] = {}
+    for e in data.get('errors', []):
+        try:
+            code = int(e['code'])
+        except Exception:
+            continue
+        table[code] = ErrorInfo(
+            e.get('name', ''),
+            e.get('category', ''),
+            e.get('default_level', 'error'),
+            e.get('message', ''),
+        )
+    return table
+
+
+_error_table: Optional[Dict[int, ErrorInfo]] = None
+_error_table_lock = threading.Lock()
+
+
+def _get_error_table() -> Dict[int, ErrorInfo]:
+    global _error_table
+    table = _error_table
+    if table is None:
+        with _error_table_lock:
+            if _error_table is None:
+                _error_table = _load_error_table(_errorlists_path())
+            table = _error_table
+    return table
+
+
+def get_error_info(code: int) -> Optional[ErrorInfo]:
+    """返回错误码对应的 `ErrorInfo`；未登记的错误码返回 None。"""
+    return _get_error_table().get(code)
+
+
+def __getattr__(name):
+    # `ERROR_TABLE` is loaded on first access (see `_get_error_table`)
+    if name == "ERROR_TABLE":
+        return _get_error_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["ErrorInfo", "ERROR_TABLE", "get_error_info"]
@@ -110,17 +110,7 @@ class Node(BaseNode, ABC):
             return []
 
         # 确保返回列表
-        if not isinstance(activated_indices, list):
-            activated_indices = []
-
-        # 强制转换为列表以满足静态类型检查与后续迭代
-        if isinstance(activated_indices, list):
-            activated_list: List[int] = list(activated_indices)
-        else:
-            try:
-                activated_list = list(activated_indices)  # type: ignore
-            except Exception:
-                activated_list = []
+        activated_list: List[int] = activated_indices if isinstance(activated_indices, list) else []
 
         # 4) 中断检查与输出触发
         interrupt = getattr(self, "interrupt", None)
@@ -132,46 +122,52 @@ class Node(BaseNode, ABC):
                 pass
             return []
 
+        activated_targets = self._activate_outputs(activated_list)
+
+        # 5) 更新监听器为 SILENT
+        if listener is not None:
+            try:
+                listener.set_state(self.node_id, "SILENT")
+            except Exception:
+                pass
+
+        return activated_targets
+
+    def _activate_outputs(self, activated_indices: List[int]) -> List[int]:
+        """按 outputs 索引触发后置引脚并缓存激活信息，返回激活的目标节点 id 列表。"""
+        # 循环外取出运行时对象，避免每次迭代重复属性查找
+        output_table = self.output_table
+        pin_manager = self.pin_manager
+        ex_hub = getattr(self, "ex_hub", None)
+
         activated_targets: List[int] = []
-        for idx in activated_list:
-            target = self.output_table.get(int(idx))
+        for idx in activated_indices:
+            target = output_table.get(int(idx))
             if target is None:
                 # 终点
-                if self.pin_manager is not None:
+                if pin_manager is not None:
                     try:
-                        self.pin_manager.activate(-1)
+                        pin_manager.activate(-1)
                     except Exception:
                         pass
                 continue
 
             activated_targets.append(target)
             # 触发目标引脚（节点间通信通过 PinManager）
-            if self.pin_manager is not None:
+            if pin_manager is not None:
                 try:
-                    self.pin_manager.activate(target)
+                    pin_manager.activate(target)
                 except Exception:
                     pass
 
             # 向前端缓存激活信息（ex_hub 用于前端/后端通信，非节点间消息传递）
-            ex_hub = getattr(self, "ex_hub", None)
             if ex_hub is not None:
                 try:
                     ex_hub.cache(self.node_id, {"activated": target})
                 except Exception:
                     pass
 
-        # 5) 更新监听器为 SILENT
-        if listener is not None:
-            try:
-                listener.set_state(self.node_id, "SILENT")
-            except Exception:
-                pass
-
         return activated_targets
-    
-
-
-
 
     #暂时不使用：
     def run(self) -> List[int]:
@@ -188,35 +184,4 @@ class Node(BaseNode, ABC):
             except Exception:
                 activated_indices = []
 
-        activated_targets: List[int] = []
-        for idx in activated_indices:
-            target = self.output_table.get(int(idx))
-            if target is None:
-                if self.pin_manager is not None:
-                    try:
-                        self.pin_manager.activate(-1)
-                    except Exception:
-                        pass
-                continue
-
-            activated_targets.append(target)
-            # 使用 PinManager 激活目标引脚（节点间不通过 in_hub）
-            if self.pin_manager is not None:
-                try:
-                    self.pin_manager.activate(target)
-                except Exception:
-                    pass
-
-            # 向前端缓存激活信息（ex_hub 仍可用于前端/后端通信）
-            ex_hub = getattr(self, "ex_hub", None)
-            if ex_hub is not None:
-                try:
-                    ex_hub.cache(self.node_id, {"activated": target})
-                except Exception:
-                    pass
-
-        return activated_targets
-    
-
-
-
+        return self._activate_outputs(activated_indices)
@@ -8,6 +8,7 @@
 - `find_plugin(node_type: str, data: dict, **runtime_kwargs) -> object`：返回已实例化的插件节点对象。
 """
 
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, Dict, Optional, List, Callable
 from Logger import PluginImportError
@@ -52,32 +53,14 @@ def _ensure_defaults(in_hub, ex_hub, interrupt, listener, pin_manager):
 	return in_hub, ex_hub, interrupt, listener, pin_manager
 
 
-def find_plugin(
-	node_type: str,
-	data: Dict[str, Any],
-	in_hub=None,
-	ex_hub=None,
-	interrupt=None,
-	listener=None,
-	pin_manager=None,
-	contexts: Optional[List[Any]] = None,
-	node_getter: Optional[Callable[[int], Any]] = None,
-	**runtime_kwargs,
-) -> Any:
-	"""尝试按以下顺序加载插件并实例化：
+@lru_cache(maxsize=None)
+def _resolve_plugin_class(node_type: str) -> Any:
+	"""按 `node_type` 解析插件类并缓存结果（失败不缓存，下次会重试）。
 
 	1. 尝试导入 `Plugins.{node_type}` 并获取 `Self_Node`。
 	2. 若不存在则尝试 `Plugins.{node_type.lower()}`（容错大小写）。
-	3. 若找不到则抛出 `ImportError`。
-
-	`runtime_kwargs` 会被传入插件构造函数，用于绑定 `in_hub`/`ex_hub`/`interrupt` 等运行时对象。
+	3. 若找不到则抛出 `PluginImportError`。
 	"""
-
-	# Ensure runtime defaults exist if not provided
-	in_hub, ex_hub, interrupt, listener, pin_manager = _ensure_defaults(
-		in_hub, ex_hub, interrupt, listener, pin_manager
-	)
-
 	candidates = [node_type, node_type.lower()]
 	last_err: Optional[Exception] = None
 	for name in candidates:
@@ -98,32 +81,59 @@ def find_plugin(
 			last_err = ImportError(f"Module {module_name} found but no Self_Node/PluginNode/Node class present")
 			continue
 
-		# Merge explicit runtime objects into kwargs (explicit params take precedence)
-		merged_kwargs = dict(runtime_kwargs)
-		merged_kwargs.setdefault("in_hub", in_hub)
-		merged_kwargs.setdefault("ex_hub", ex_hub)
-		merged_kwargs.setdefault("interrupt", interrupt)
-		merged_kwargs.setdefault("listener", listener)
-		merged_kwargs.setdefault("pin_manager", pin_manager)
-		merged_kwargs.setdefault("contexts", list(contexts) if contexts is not None else [])
-		# Allow plugins to get other node instances via an injected getter (node_id -> Node)
-		merged_kwargs.setdefault("node_getter", node_getter)
-
-		# Provide global llm_config module to LLM plugins (if they choose to use it)
-		try:
-			from Workflow import llm_config
-			merged_kwargs.setdefault("llm_config", llm_config)
-		except Exception:
-			# ignore if module not available
-			pass
-
-		# Instantiate with data and runtime kwargs
-		try:
-			instance = cls(data, **merged_kwargs)
-			return instance
-		except TypeError:
-			# Fallback: try passing only data
-			instance = cls(data)
-			return instance
+		return cls
 
 	raise PluginImportError(f"Could not load plugin for type '{node_type}'") from last_err
+
+
+def find_plugin(
+	node_type: str,
+	data: Dict[str, Any],
+	in_hub=None,
+	ex_hub=None,
+	interrupt=None,
+	listener=None,
+	pin_manager=None,
+	contexts: Optional[List[Any]] = None,
+	node_getter: Optional[Callable[[int], Any]] = None,
+	**runtime_kwargs,
+) -> Any:
+	"""按 `node_type` 加载插件类（见 `_resolve_plugin_class`，结果按类型缓存）并实例化。
+
+	`runtime_kwargs` 会被传入插件构造函数，用于绑定 `in_hub`/`ex_hub`/`interrupt` 等运行时对象。
+	"""
+
+	# Ensure runtime defaults exist if not provided
+	in_hub, ex_hub, interrupt, listener, pin_manager = _ensure_defaults(
+		in_hub, ex_hub, interrupt, listener, pin_manager
+	)
+
+	cls = _resolve_plugin_class(node_type)
+
+	# Merge explicit runtime objects into kwargs (explicit params take precedence)
+	merged_kwargs = dict(runtime_kwargs)
+	merged_kwargs.setdefault("in_hub", in_hub)
+	merged_kwargs.setdefault("ex_hub", ex_hub)
+	merged_kwargs.setdefault("interrupt", interrupt)
+	merged_kwargs.setdefault("listener", listener)
+	merged_kwargs.setdefault("pin_manager", pin_manager)
+	merged_kwargs.setdefault("contexts", list(contexts) if contexts is not None else [])
+	# Allow plugins to get other node instances via an injected getter (node_id -> Node)
+	merged_kwargs.setdefault("node_getter", node_getter)
+
+	# Provide global llm_config module to LLM plugins (if they choose to use it)
+	try:
+		from Workflow import llm_config
+		merged_kwargs.setdefault("llm_config", llm_config)
+	except Exception:
+		# ignore if module not available
+		pass
+
+	# Instantiate with data and runtime kwargs
+	try:
+		instance = cls(data, **merged_kwargs)
+		return instance
+	except TypeError:
+		# Fallback: try passing only data
+		instance = cls(data)
+		return instance
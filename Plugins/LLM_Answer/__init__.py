@@ -17,10 +17,31 @@ class Self_Node(Node):
     - `answer` (str): LLM 生成的文本回答（默认键，可由 `param_config.key` 覆盖）。
     """
 
+    # 子类的缺省 prompt_template；None 表示不设缺省（直接拼接上下文）
+    DEFAULT_PROMPT_TEMPLATE: Optional[str] = None
+
     def __init__(self, data: dict, llm_config=None, **kwargs) -> None:
         super().__init__(data, **kwargs)
         # llm_config 可以是 Workflow.llm_config 模块或 None
         self.llm_config = llm_config
+        self._apply_default_prompt_template()
+
+    def _default_prompt_template(self, param_config: Dict[str, Any]) -> Optional[str]:
+        """返回缺省 prompt_template；需要依赖 param_config 的子类可覆盖此方法。"""
+        return self.DEFAULT_PROMPT_TEMPLATE
+
+    def _apply_default_prompt_template(self) -> None:
+        try:
+            params = self.params or {}
+            pc = params.get("param_config", {}) or {}
+            template = self._default_prompt_template(pc)
+            if template is None:
+                return
+            # 合并为新 dict，不修改调用方传入的 params / param_config（如工作流数据）；
+            # 用户显式给出的 prompt_template 优先
+            self.params = {**params, "param_config": {"prompt_template": template, **pc}}
+        except Exception:
+            pass
 
     def _gather_contexts(self) -> List[str]:
         params = self.params or {}
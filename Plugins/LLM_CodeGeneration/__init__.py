@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict
 
 from Plugins.LLM_Answer import Self_Node as BaseLLM
 
@@ -9,14 +9,6 @@ class Self_Node(BaseLLM):
     可通过 `params.param_config.language` 指定目标编程语言。
     """
 
-    def __init__(self, data: dict, **kwargs) -> None:
-        super().__init__(data, **kwargs)
-        try:
-            params = self.params or {}
-            pc = params.get("param_config", {}) or {}
-            lang = pc.get("language", "Python")
-            pc.setdefault("prompt_template", f"Generate {lang} code for the following specification:\n{{context}}")
-            params["param_config"] = pc
-            self.params = params
-        except Exception:
-            pass
+    def _default_prompt_template(self, param_config: Dict[str, Any]) -> str:
+        lang = param_config.get("language", "Python")
+        return f"Generate {lang} code for the following specification:\n{{context}}"
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict
 
 from Plugins.LLM_Answer import Self_Node as BaseLLM
 
@@ -9,14 +9,6 @@ class Self_Node(BaseLLM):
     如果需要目标语言，请在 `params.param_config.target_lang` 中指定。
     """
 
-    def __init__(self, data: dict, **kwargs) -> None:
-        super().__init__(data, **kwargs)
-        try:
-            params = self.params or {}
-            pc = params.get("param_config", {}) or {}
-            target = pc.get("target_lang", "English")
-            pc.setdefault("prompt_template", f"Translate the context to {target}:\n{{context}}")
-            params["param_config"] = pc
-            self.params = params
-        except Exception:
-            pass
+    def _default_prompt_template(self, param_config: Dict[str, Any]) -> str:
+        target = param_config.get("target_lang", "English")
+        return f"Translate the context to {target}:\n{{context}}"
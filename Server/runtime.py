@@ -40,29 +40,27 @@ async def run_workflow(body: Dict[str, Any]):
 
     async def event_generator():
         # send initial snapshot
-        states = []
+        last_version = -1
         try:
-            states = engine.listener.read()
+            last_version, states = engine.listener.snapshot()
             payload_out = {"workflow_id": wid, "states": states}
             yield f"data: {json.dumps(payload_out, ensure_ascii=False)}\n\n"
         except Exception:
             yield f"data: {json.dumps({'error': 'failed to read initial states'}, ensure_ascii=False)}\n\n"
 
-        last_snapshot = json.dumps(states, sort_keys=True)
-
-        # poll for changes until engine task finishes
+        # poll for changes until engine task finishes; the listener version
+        # changes only when a node state actually changes
         while True:
             await asyncio.sleep(0.5)
             try:
-                states = engine.listener.read()
+                version = engine.listener.version
+                if version != last_version:
+                    version, states = engine.listener.snapshot()
+                    payload_out = {"workflow_id": wid, "states": states}
+                    yield f"data: {json.dumps(payload_out, ensure_ascii=False)}\n\n"
+                    last_version = version
             except Exception:
-                states = []
-
-            snap = json.dumps(states, sort_keys=True)
-            if snap != last_snapshot:
-                payload_out = {"workflow_id": wid, "states": states}
-                yield f"data: {json.dumps(payload_out, ensure_ascii=False)}\n\n"
-                last_snapshot = snap
+                pass
 
             # if background task finished, send final snapshot and close stream
             task = getattr(engine, "_task", None)
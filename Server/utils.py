@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 BASE = os.getcwd()
@@ -13,10 +13,26 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+# (mtime_ns, size) of pluginLists.json -> parsed content
+_plugin_lists_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+
 def read_plugin_lists() -> Dict[str, Any]:
+    """读取插件列表；文件未变化（mtime/size 相同）时直接返回上次解析结果。
+
+    返回的 dict 在多次调用间共享，调用方只读使用，勿原地修改。
+    """
+    global _plugin_lists_cache
     try:
+        st = os.stat(PLUGIN_LISTS)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _plugin_lists_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         with open(PLUGIN_LISTS, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
+        _plugin_lists_cache = (key, data)
+        return data
     except Exception:
         return {"basic_plugins": [], "llm_plugins": []}
 
@@ -1,9 +1,19 @@
 from threading import Lock
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 
 from Logger import UnregisteredStateError
 
 
+ALLOWED_STATES: FrozenSet[str] = frozenset({
+    "ACTIVE",
+    "SILENT",
+    "TEXT_INPUT",
+    "NUMBER_INPUT",
+    "CHECKBOX",
+    "OUTPUT",
+})
+
+
 class FlowListener:
     """状态监视器总线:维护节点状态表并提供线程安全的读/写接口。
 
@@ -11,27 +21,26 @@ class FlowListener:
     - `set_state(node_id, state)`：写入节点状态（仅允许预定义状态）
     - `get_state(node_id)`：读取单个节点状态
     - `read()`：读取全部状态快照
+    - `snapshot()`：读取 (版本号, 状态快照)；版本号在任一节点状态实际变化时递增，
+      轮询方只需比较版本号即可判断是否有变化，无需序列化比较整张表
     """
 
     def __init__(self) -> None:
         self._lock = Lock()
         self._state_table: Dict[int, str] = {}
-        #静态状态集合
-        self._allowed_states: List[str] = [
-            "ACTIVE",
-            "SILENT",
-            "TEXT_INPUT",
-            "NUMBER_INPUT",
-            "CHECKBOX",
-            "OUTPUT"
-        ]
+        self._version = 0
+        #静态状态集合（每次状态切换都要校验，用 frozenset 做 O(1) 判断）
+        self._allowed_states: FrozenSet[str] = ALLOWED_STATES
 
     def set_state(self, node_id: int, state: str) -> None:
         """设置节点的状态（线程安全）。若状态不在静态集合中则抛错。"""
         with self._lock:
             if state not in self._allowed_states:
                 raise UnregisteredStateError(f"Unregistered state: {state}")
-            self._state_table[int(node_id)] = state
+            nid = int(node_id)
+            if self._state_table.get(nid) != state:
+                self._state_table[nid] = state
+                self._version += 1
 
     def get_state(self, node_id: int) -> Optional[str]:
         """获取指定节点的当前状态；不存在返回 None。"""
@@ -41,4 +50,15 @@ class FlowListener:
     def read(self) -> List[Dict[str, Any]]:
         """返回当前状态表快照：[{"node_id": id, "state": state}, ...]。"""
         with self._lock:
-            return [{"node_id": nid, "state": st} for nid, st in self._state_table.items()]
\ No newline at end of file
+            return [{"node_id": nid, "state": st} for nid, st in self._state_table.items()]
+
+    @property
+    def version(self) -> int:
+        """状态表的版本号（每次实际状态变化递增）。"""
+        with self._lock:
+            return self._version
+
+    def snapshot(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """原子地返回 (版本号, 状态快照)。"""
+        with self._lock:
+            return self._version, [{"node_id": nid, "state": st} for nid, st in self._state_table.items()]
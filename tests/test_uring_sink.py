@@ -0,0 +1,152 @@
+"""UringFileSink 在伪造 ring 上的错误路径测试（不需要 liburing / io_uring 内核支持）。
+
+伪造的 `liburing` 按顺序执行已提交的 SQE：写入失败或短写会使同一链上后续的 SQE
+以 -ECANCELED 完成，与内核 `IOSQE_IO_LINK` 的语义一致。`raise_errors=True` 时
+错误以 `OSError` 抛出（PyPI `liburing` 绑定的行为），否则返回负 errno。
+"""
+import errno
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from Logger.LOGGER import _uring_sink
+from Logger.LOGGER._uring_sink import UringFileSink
+
+
+class _Sqe:
+    def __init__(self):
+        self.op = None
+        self.link = False
+        self.data = 0
+
+
+class _FakeRing:
+    def __init__(self):
+        self.pending = []
+        self.completions = []
+
+
+class _FakeCqe:
+    res = 0
+    data = 0
+
+
+class FakeLiburing:
+    IOSQE_IO_LINK = 1
+
+    def __init__(self, fail_index=None, short_index=None, submit_errno=None, wait_eintr=0, raise_errors=False):
+        self.fail_index = fail_index
+        self.short_index = short_index
+        self.submit_errno = submit_errno
+        self.wait_eintr = wait_eintr
+        self.raise_errors = raise_errors
+
+    def _error(self, err):
+        if self.raise_errors:
+            raise OSError(err, os.strerror(err))
+        return -err
+
+    io_uring = _FakeRing
+    io_uring_cqe = _FakeCqe
+
+    def io_uring_queue_init(self, entries, ring, flags):
+        return 0
+
+    def io_uring_queue_exit(self, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = _Sqe()
+        ring.pending.append(sqe)
+        return sqe
+
+    def io_uring_prep_write(self, sqe, fd, buf, nbytes, offset):
+        sqe.op = ("write", fd, bytes(buf[:nbytes]))
+
+    def io_uring_prep_fsync(self, sqe, fd, flags):
+        sqe.op = ("fsync", fd)
+
+    def io_uring_sqe_set_flags(self, sqe, flags):
+        sqe.link = bool(flags & self.IOSQE_IO_LINK)
+
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe.data = data
+
+    def io_uring_submit(self, ring):
+        if self.submit_errno is not None:
+            return self._error(self.submit_errno)
+        taken, ring.pending = ring.pending, []
+        cancelled = False
+        for sqe in taken:
+            if cancelled:
+                res = -errno.ECANCELED
+            elif sqe.op[0] == "fsync":
+                res = 0
+            elif sqe.data == self.fail_index:
+                res = -errno.ENOSPC
+            else:
+                data = sqe.op[2]
+                if sqe.data == self.short_index:
+                    data = data[:2]
+                res = os.write(sqe.op[1], data)
+            ring.completions.append((sqe.data, res))
+            expected = len(sqe.op[2]) if sqe.op[0] == "write" else 0
+            # a failed or short link breaks the rest of the chain
+            cancelled = sqe.link and res != expected
+        return len(taken)
+
+    def io_uring_wait_cqe(self, ring, cqe):
+        if self.wait_eintr:
+            self.wait_eintr -= 1
+            return self._error(errno.EINTR)
+        cqe.data, cqe.res = ring.completions.pop(0)
+        return 0
+
+    def io_uring_cqe_get_data64(self, cqe):
+        return cqe.data
+
+    def io_uring_cqe_seen(self, ring, cqe):
+        pass
+
+
+LINES = [b"first line\n", b"second line\n", b"third line\n"]
+
+
+class UringFileSinkTest(unittest.TestCase):
+    def _run(self, fake):
+        with tempfile.TemporaryDirectory() as d, mock.patch.object(_uring_sink, "liburing", fake):
+            path = os.path.join(d, "log.jsonl")
+            sink = UringFileSink(path)
+            try:
+                for line in LINES:
+                    sink.write(line)
+                sink.flush()
+                broken = sink._broken
+            finally:
+                sink.close()
+            with open(path, "rb") as f:
+                return f.read(), broken
+
+    def test_all_writes_complete(self):
+        self.assertEqual(self._run(FakeLiburing()), (b"".join(LINES), False))
+
+    def test_short_write_is_finished(self):
+        self.assertEqual(self._run(FakeLiburing(short_index=1)), (b"".join(LINES), False))
+
+    def test_failed_write_and_cancelled_links_are_rewritten(self):
+        # index 0 fails with ENOSPC, the rest of the chain completes with -ECANCELED
+        self.assertEqual(self._run(FakeLiburing(fail_index=0)), (b"".join(LINES), False))
+
+    def test_submit_error_breaks_ring(self):
+        self.assertEqual(self._run(FakeLiburing(submit_errno=errno.EINVAL)), (b"".join(LINES), True))
+
+    def test_raised_errors_take_the_same_path(self):
+        fake = FakeLiburing(short_index=1, wait_eintr=2, raise_errors=True)
+        self.assertEqual(self._run(fake), (b"".join(LINES), False))
+        fake = FakeLiburing(submit_errno=errno.EINVAL, raise_errors=True)
+        self.assertEqual(self._run(fake), (b"".join(LINES), True))
+
+
+if __name__ == "__main__":
+    unittest.main()